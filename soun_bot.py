@@ -1,37 +1,129 @@
 """
 SOUN Cycle Bot: Buy 1 share → DCA based on that price → Repeat cycle
+
+Runs one cycle per symbol in SYMBOLS (comma-separated, default SOUN) on a
+single event loop, sharing one REST client, one worker pool and one quote
+websocket.
 """
 
 import os
+import atexit
+import random
+import functools
+import sys
+import logging
+from logging.handlers import RotatingFileHandler
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
 from dotenv import load_dotenv
 import alpaca_trade_api as tradeapi
-import json
-from datetime import datetime
+import orjson
+from datetime import datetime, timedelta
 import time
+from concurrent.futures import ThreadPoolExecutor
+from zoneinfo import ZoneInfo
 
 load_dotenv()
 
+log = logging.getLogger('soun')
+
+MARKET_TZ = ZoneInfo('America/New_York')
+CALENDAR_FILE = 'soun_calendar_cache.json'
+
+def worker_count(n_bots):
+    """Worker threads for n bots: each cycle issues up to 3 concurrent REST calls"""
+    return min(32, 3 * n_bots)
+
+def create_api(pool_size=None):
+    api = tradeapi.REST(
+        os.getenv('ALPACA_API_KEY'),
+        os.getenv('ALPACA_SECRET_KEY'),
+        os.getenv('ALPACA_BASE_URL'),
+        api_version='v2'
+    )
+    # One keep-alive pool per host (trading API + data API), each as large as the
+    # worker pool so concurrent calls never overflow it and re-handshake. Retry only
+    # resends a POST when the connection itself failed, so orders never duplicate
+    api._session.mount('https://', HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=pool_size or worker_count(1),
+        max_retries=Retry(total=3, backoff_factor=0.5)
+    ))
+    return api
+
+def create_stream():
+    return tradeapi.Stream(
+        os.getenv('ALPACA_API_KEY'),
+        os.getenv('ALPACA_SECRET_KEY'),
+        os.getenv('ALPACA_BASE_URL')
+    )
+
+def retry_transient(initial=1, maximum=300, jitter=0.2):
+    """Retry an async function on network/API errors with jittered exponential backoff"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            delay = initial
+            while True:
+                try:
+                    return await func(*args, **kwargs)
+                except (requests.RequestException, tradeapi.rest.APIError) as e:
+                    # ±jitter so clients hit by the same outage don't all retry in the same second
+                    wait = delay * random.uniform(1 - jitter, 1 + jitter)
+                    log.warning("\n❌ API error: %s", e)
+                    log.warning("⏳ Retrying in %.1fs...", wait)
+                    await asyncio.sleep(wait)
+                    delay = min(maximum, delay * 2)
+        return wrapper
+    return decorator
+
 class SOUNCycleBot:
-    def __init__(self):
-        self.api = tradeapi.REST(
-            os.getenv('ALPACA_API_KEY'),
-            os.getenv('ALPACA_SECRET_KEY'),
-            os.getenv('ALPACA_BASE_URL'),
-            api_version='v2'
-        )
-        self.symbol = 'SOUN'
+    def __init__(self, symbol='SOUN', api=None, stream=None, executor=None):
+        self.api = api or create_api()
+        self.symbol = symbol
+        self.log = log
         self.dca_amount = 20.0
+        self.data_file = f'{symbol.lower()}_cycle_data.json'
+        self.wal_file = f'{symbol.lower()}_cycle_data.wal'
+        
+        # Quote stream (single websocket shared by all bots, kept open across cycles)
+        self.stream = stream or create_stream()
+        self.latest_price = None
+        self.latest_quote_ts = 0  # time.monotonic() when latest_price arrived
+        self.quote_max_age = 5  # Older streamed prices fall back to REST
+        self.price_event = asyncio.Event()
+        self._quote_armed = True  # Whether a quote may trigger a cycle before the next tick
+        self._action_failed = False  # Cycle tried to trade but the order failed or was skipped
+        
+        # Market clock/calendar cache + idle cadence
+        self.clock_ttl = 60  # Re-fetch clock at most once a minute
+        self._clock_cache = {'ts': 0, 'value': None}
+        self.calendar = {}  # 'YYYY-MM-DD' -> ['HH:MM' open, 'HH:MM' close]
+        self._calendar_date = None
+        self.last_action_ts = 0
+        self._tick_t0 = time.monotonic()  # Status ticks run on a fixed grid from here
+        self._account_cache = (0, None)  # (fetched at, account)
+        self._position_cache = None  # (shares, invested, avg_cost) until the next trade
+        self._last_idle_key = None  # Last idle state logged at INFO
+        
+        # Worker threads (shared by all bots) so REST calls run concurrently and off the event loop
+        self._executor = executor or ThreadPoolExecutor(max_workers=worker_count(1))
         
         # Load saved data
+        snapshot_seq = 0  # Last WAL record already folded into the snapshot
         try:
-            with open('soun_cycle_data.json', 'r') as f:
-                self.data = json.load(f)
+            with open(self.data_file, 'rb') as f:
+                self.data = orjson.loads(f.read())
+                snapshot_seq = self.data.pop('wal_seq', 0)
                 # Add new fields if they don't exist (for existing data files)
                 if 'trades_today' not in self.data:
                     self.data['trades_today'] = 0
                 if 'last_trade_date' not in self.data:
                     self.data['last_trade_date'] = None
-        except:
+        except FileNotFoundError:
+            # First run - a corrupt snapshot raises instead of wiping the position
             self.data = {
                 'last_single_share_price': None,  # Price of last single share bought
                 'total_invested': 0.0,
@@ -40,20 +132,103 @@ class SOUNCycleBot:
                 'trades_today': 0,
                 'last_trade_date': None
             }
+        
+        # Replay write-ahead log on top of the snapshot
+        self._wal_seq = snapshot_seq
+        try:
+            with open(self.wal_file, 'r+b') as f:
+                good_end = 0  # Byte offset just past the last complete record
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break  # Torn last line from a crash mid-append
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        break
+                    good_end += len(line)
+                    seq = record.get('seq', 0)
+                    if snapshot_seq and seq <= snapshot_seq:
+                        continue  # Already in the snapshot (crash between replace and truncate)
+                    self.data.update(record['delta'])
+                    self._wal_seq = max(self._wal_seq, seq)
+                
+                # Cut the torn tail so new appends start on a clean line
+                if f.seek(0, os.SEEK_END) > good_end:
+                    self.log.warning("⚠️ Dropping torn WAL tail at byte %d", good_end)
+                    f.truncate(good_end)
+                    os.fsync(f.fileno())
+        except FileNotFoundError:
+            pass
+        
+        # last_trade_date used to be stored as a 'YYYY-MM-DD' string
+        if isinstance(self.data['last_trade_date'], str):
+            self.data['last_trade_date'] = int(self.data['last_trade_date'].replace('-', ''))
+        self._saved = dict(self.data)  # State already on disk (snapshot + WAL)
+        self._dirty = False
+        self._compact_pending = False  # Day rolled over; compact on next flush
+        self._wal = open(self.wal_file, 'ab')  # Held open: each save is one small in-place append
+        atexit.register(self.close)
     
     def save_data(self):
-        with open('soun_cycle_data.json', 'w') as f:
-            json.dump(self.data, f)
+        """Append changed fields to the write-ahead log"""
+        delta = {k: v for k, v in self.data.items() if k not in self._saved or self._saved[k] != v}
+        if not delta:
+            return
+        
+        self._wal_seq += 1
+        self._wal.write(orjson.dumps({'seq': self._wal_seq, 't': time.time(), 'delta': delta}) + b'\n')
+        self._wal.flush()
+        os.fsync(self._wal.fileno())
+        self._saved.update(delta)
+    
+    def _compact(self):
+        """Rewrite the full snapshot atomically and truncate the WAL"""
+        # The snapshot records the WAL seq it covers, so replay skips those records
+        # if we die before the truncate below
+        self._wal_seq += 1
+        tmp_file = self.data_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps({**self.data, 'wal_seq': self._wal_seq}))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.data_file)
+        
+        self._wal.truncate(0)
+        os.fsync(self._wal.fileno())
+        self._saved = dict(self.data)
+        self._dirty = False
+        self._compact_pending = False
+    
+    def _flush(self):
+        """Persist pending changes once, at the end of a cycle"""
+        if not self._dirty:
+            return
+        if self._compact_pending:
+            self._compact()  # First write of a new day: fold the WAL into the snapshot
+        else:
+            self.save_data()
+            self._dirty = False
+    
+    def close(self):
+        """Persist any in-memory state (e.g. a day reset) on graceful shutdown"""
+        if self._wal.closed:
+            return
+        if self._compact_pending:
+            self._compact()
+        else:
+            self.save_data()
+        self._wal.close()
     
     def check_daily_trade_limit(self):
         """Check if we can still trade today (max 2 trades)"""
-        today = datetime.now().strftime('%Y-%m-%d')
+        d = datetime.now()
+        today = d.year * 10000 + d.month * 100 + d.day  # YYYYMMDD as int
         
         # Reset counter if new day
         if self.data['last_trade_date'] != today:
             self.data['trades_today'] = 0
             self.data['last_trade_date'] = today
-            self.save_data()
+            self._compact_pending = True  # In memory only; persisted with the next trade
         
         if self.data['trades_today'] >= 2:
             return False, f"Daily limit reached: {self.data['trades_today']}/2 trades"
@@ -63,38 +238,160 @@ class SOUNCycleBot:
     def record_trade(self):
         """Record that a trade was made"""
         self.data['trades_today'] += 1
-        self.save_data()
+        self._dirty = True
+    
+    def get_account(self):
+        """Account snapshot, cached for a few seconds"""
+        ts, account = self._account_cache
+        if account is None or time.time() - ts >= 5:
+            account = self.api.get_account()
+            self._account_cache = (time.time(), account)
+        return account
     
     def get_balance(self):
-        account = self.api.get_account()
-        return float(account.buying_power)
+        return float(self.get_account().buying_power)
+    
+    def get_position(self):
+        """Broker's position for the symbol (None if we hold none)"""
+        try:
+            return self.api.get_position(self.symbol)
+        except tradeapi.rest.APIError as e:
+            if e.status_code == 404:
+                return None
+            raise
+    
+    def position_summary(self, position):
+        """(shares, invested, avg_cost) from the broker position, else local totals"""
+        # Right after an order the broker may not show the fill yet - use local
+        # totals and keep re-fetching until it settles
+        settled = time.time() - self.last_action_ts > 60
+        
+        # Otherwise broker's numbers preferred - local totals drift on partial fills
+        if position is not None and settled:
+            shares = float(position.qty)
+            invested = float(position.cost_basis)
+        else:
+            shares = self.data['total_shares']
+            invested = self.data['total_invested']
+        avg_cost = invested / shares if shares > 0 else 0.0
+        
+        if settled:
+            self._position_cache = (shares, invested, avg_cost)
+        return shares, invested, avg_cost
     
     def has_sufficient_funds(self, balance, needed_amount):
         """Check if we have enough money to continue"""
         if balance >= needed_amount:
             return True
         else:
-            print(f"\n🚨 INSUFFICIENT FUNDS - BOT STOPPING!")
-            print(f"   Need: ${needed_amount:.2f}")
-            print(f"   Have: ${balance:.2f}")
-            print(f"   ADD: ${needed_amount - balance:.2f}")
-            print(f"🛑 Bot will stop until funds are added...")
+            self.log.warning("\n🚨 INSUFFICIENT FUNDS - BOT STOPPING!")
+            self.log.warning("   Need: $%.2f", needed_amount)
+            self.log.warning("   Have: $%.2f", balance)
+            self.log.warning("   ADD: $%.2f", needed_amount - balance)
+            self.log.warning("🛑 Bot will stop until funds are added...")
             return False
     
-    def is_market_open(self):
-        """Check if market is open"""
+    def get_clock(self):
+        """Market clock, cached for up to clock_ttl seconds"""
+        now = time.time()
+        if self._clock_cache['value'] is None or now - self._clock_cache['ts'] >= self.clock_ttl:
+            self._clock_cache = {'ts': now, 'value': self.api.get_clock()}
+        return self._clock_cache['value']
+    
+    def load_calendar(self):
+        """Load trading calendar from disk, topping up 30 days ahead when running low"""
+        today = datetime.now(MARKET_TZ).date()
         try:
-            clock = self.api.get_clock()
-            return clock.is_open
-        except:
-            return False
+            with open(CALENDAR_FILE, 'rb') as f:
+                self.calendar = orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            self.calendar = {}
+        
+        upcoming = [day for day in self.calendar if day >= today.isoformat()]
+        if len(upcoming) < 10:
+            days = self.api.get_calendar(
+                start=today.isoformat(),
+                end=(today + timedelta(days=30)).isoformat()
+            )
+            self.calendar = {
+                c.date.strftime('%Y-%m-%d'): [c.open.strftime('%H:%M'), c.close.strftime('%H:%M')]
+                for c in days
+            }
+            # Bots refresh from worker threads - write a private temp file, then swap it in
+            tmp_file = f'{CALENDAR_FILE}.{self.symbol.lower()}.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(self.calendar))
+            os.replace(tmp_file, CALENDAR_FILE)
+        
+        self._calendar_date = today
+    
+    def seconds_until_open(self):
+        """Seconds until the market opens (0 if already open)"""
+        now = datetime.now(MARKET_TZ)
+        if self._calendar_date != now.date():
+            self.load_calendar()
+        
+        for day in sorted(self.calendar):
+            open_time, close_time = self.calendar[day]
+            market_open = datetime.strptime(f"{day} {open_time}", '%Y-%m-%d %H:%M').replace(tzinfo=MARKET_TZ)
+            market_close = datetime.strptime(f"{day} {close_time}", '%Y-%m-%d %H:%M').replace(tzinfo=MARKET_TZ)
+            if now < market_close:
+                return max(0, (market_open - now).total_seconds())
+        
+        # Calendar exhausted - fall back to the live clock
+        clock = self.get_clock()
+        if clock.is_open:
+            return 0
+        elapsed = time.time() - self._clock_cache['ts']
+        return max(0, (clock.next_open - clock.timestamp).total_seconds() - elapsed)
+    
+    def idle_timeout(self):
+        """Status refresh interval: slow down while price is far above DCA level"""
+        last_price = self.data['last_single_share_price']
+        if (self.data['waiting_for_dca'] and self.latest_price is not None
+                and self.latest_price > last_price * 1.05
+                and time.time() - self.last_action_ts > 300):
+            return 120
+        return 60
+
+    async def on_quote(self, q):
+        """Store pushed quote and wake run() when the cycle can act on it"""
+        price = q.ask_price or q.bid_price
+        if not price:
+            return
+        self.latest_price = price
+        self.latest_quote_ts = time.monotonic()
+        
+        if not self._quote_armed or self.data['trades_today'] >= 2:
+            return
+        if not self.data['waiting_for_dca'] or price < self.data['last_single_share_price']:
+            self.price_event.set()
+    
+    def subscribe(self):
+        """Route this symbol's quotes from the shared stream to on_quote"""
+        self.stream.subscribe_quotes(self.on_quote, self.symbol)
+    
+    async def wait_for_quote(self):
+        """Wait for an actionable quote, or timeout to refresh status"""
+        # Sleep to the next grid tick, not a full interval, so slow cycles don't drift
+        interval = self.idle_timeout()
+        timeout = interval - (time.monotonic() - self._tick_t0) % interval
+        try:
+            await asyncio.wait_for(self.price_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            self._quote_armed = True  # Status tick: quotes may trigger cycles again
+        self.price_event.clear()
+    
     def get_price(self):
+        if self.latest_price is not None and time.monotonic() - self.latest_quote_ts < self.quote_max_age:
+            return self.latest_price
+        # No fresh quote pushed (startup, stream down, after overnight sleep) - use a REST snapshot
         quote = self.api.get_latest_quote(self.symbol)
         return quote.ask_price or quote.bid_price
     
     def buy_single_share(self, current_price):
         """Buy 1 share at current price"""
-        print(f"🎯 BUYING 1 SHARE @ ${current_price:.2f}")
+        self.log.info("🎯 BUYING 1 SHARE @ $%.2f", current_price)
         
         try:
             order = self.api.submit_order(
@@ -105,29 +402,31 @@ class SOUNCycleBot:
                 time_in_force='day'
             )
             
-            print(f"✅ Single share order: {order.id}")
+            self.log.info("✅ Single share order: %s", order.id)
+            self._account_cache = (0, None)  # Buying power changed
+            self._position_cache = None
             
             # Update tracking
             self.data['last_single_share_price'] = current_price
             self.data['total_invested'] += current_price
             self.data['total_shares'] += 1.0
             self.data['waiting_for_dca'] = True
+            self.last_action_ts = time.time()
             self.record_trade()  # Count this trade
             
-            self.save_data()
-            print(f"✅ SINGLE SHARE BOUGHT @ ${current_price:.2f}")
-            print(f"🔄 Now waiting for price below ${current_price:.2f} to DCA")
+            self.log.info("✅ SINGLE SHARE BOUGHT @ $%.2f", current_price)
+            self.log.info("🔄 Now waiting for price below $%.2f to DCA", current_price)
             return True
             
         except Exception as e:
-            print(f"❌ Single share order failed: {e}")
+            self.log.warning("❌ Single share order failed: %s", e)
             return False
     
     def dca_buy(self, current_price):
         """DCA buy at current price"""
         shares = self.dca_amount / current_price
         
-        print(f"📈 DCA BUY: {shares:.3f} shares @ ${current_price:.2f}")
+        self.log.info("📈 DCA BUY: %.3f shares @ $%.2f", shares, current_price)
         
         try:
             order = self.api.submit_order(
@@ -138,104 +437,193 @@ class SOUNCycleBot:
                 time_in_force='day'
             )
             
-            print(f"✅ DCA order: {order.id}")
+            self.log.info("✅ DCA order: %s", order.id)
+            self._account_cache = (0, None)  # Buying power changed
+            self._position_cache = None
             
             # Update tracking
             self.data['total_invested'] += self.dca_amount
             self.data['total_shares'] += shares
+            self.last_action_ts = time.time()
             self.record_trade()  # Count this trade
             
-            self.save_data()
-            print(f"✅ DCA COMPLETE: {shares:.3f} shares @ ${current_price:.2f}")
+            self.log.info("✅ DCA COMPLETE: %.3f shares @ $%.2f", shares, current_price)
             return True
             
         except Exception as e:
-            print(f"❌ DCA order failed: {e}")
+            self.log.warning("❌ DCA order failed: %s", e)
             return False
     
-    def run(self):
+    async def run(self):
+        """Run one cycle, persisting any state changes once at the end"""
+        self._action_failed = False
+        try:
+            await self._run_cycle()
+        finally:
+            self._flush()
+            # A failed or skipped action (rejected order, short funds) waits for the
+            # status tick instead of retrying on every quote
+            self._quote_armed = not self._action_failed
+            self.price_event.clear()  # Quotes seen mid-cycle were judged on the old state
+    
+    async def _run_cycle(self):
         """Main bot cycle logic"""
-        print("🔄 SOUN CYCLE BOT RUNNING...")
-        print("=" * 50)
-        
-        balance = self.get_balance()
-        current_price = self.get_price()
-        
-        print(f"💰 Balance: ${balance:.2f}")
-        print(f"📊 SOUN: ${current_price:.2f}")
+        # Fetch balance, price (and position if a trade invalidated it) concurrently
+        loop = asyncio.get_running_loop()
+        calls = [self.get_balance, self.get_price]
+        if self._position_cache is None:
+            calls.append(self.get_position)
+        results = await asyncio.gather(*(loop.run_in_executor(self._executor, call) for call in calls))
+        balance, current_price = results[:2]
+        position = results[2] if len(results) > 2 else None
         
         # Check daily trade limit
         can_trade, trade_msg = self.check_daily_trade_limit()
-        print(f"📈 {trade_msg}")
+        
+        # Idle states (limit reached / waiting above DCA level) repeat every
+        # cycle - log them once, then demote identical repeats to DEBUG
+        if not can_trade:
+            idle_key = ('limit', self.data['last_trade_date'])
+        elif self.data['waiting_for_dca'] and current_price >= self.data['last_single_share_price']:
+            idle_key = ('waiting', self.data['last_single_share_price'], self.data['trades_today'])
+        else:
+            idle_key = None
+        level = logging.DEBUG if idle_key is not None and idle_key == self._last_idle_key else logging.INFO
+        self._last_idle_key = idle_key
+        
+        self.log.log(level, "🔄 %s CYCLE BOT RUNNING...", self.symbol)
+        self.log.log(level, "=" * 50)
+        self.log.log(level, "💰 Balance: $%.2f", balance)
+        self.log.log(level, "📊 %s: $%.2f", self.symbol, current_price)
+        self.log.log(level, "📈 %s", trade_msg)
         
         if not can_trade:
-            print("🛑 Daily trade limit reached, waiting for tomorrow")
+            self.log.log(level, "🛑 Daily trade limit reached, waiting for tomorrow")
             return
         
         # CYCLE LOGIC:
         
         # If no previous single share OR not waiting for DCA = BUY 1 SHARE
         if not self.data['waiting_for_dca']:
-            print("🎯 CYCLE: Time to buy 1 share")
+            self.log.log(level, "🎯 CYCLE: Time to buy 1 share")
             if balance >= current_price:
-                self.buy_single_share(current_price)
+                if not await loop.run_in_executor(self._executor, self.buy_single_share, current_price):
+                    self._action_failed = True
             else:
-                print(f"🚨 INSUFFICIENT FUNDS!")
-                print(f"   Need: ${current_price:.2f} for 1 share")
-                print(f"   Have: ${balance:.2f}")
+                self._action_failed = True
+                self.log.warning("🚨 INSUFFICIENT FUNDS!")
+                self.log.warning("   Need: $%.2f for 1 share", current_price)
+                self.log.warning("   Have: $%.2f", balance)
         
         # If waiting for DCA = check if price dropped below last single share price
         else:
             last_price = self.data['last_single_share_price']
-            print(f"🔄 CYCLE: Waiting for price below ${last_price:.2f}")
+            self.log.log(level, "🔄 CYCLE: Waiting for price below $%.2f", last_price)
             
             if current_price < last_price:
-                print(f"✅ PRICE DROPPED! ${current_price:.2f} < ${last_price:.2f}")
+                self.log.log(level, "✅ PRICE DROPPED! $%.2f < $%.2f", current_price, last_price)
                 
                 if balance >= self.dca_amount:
-                    if self.dca_buy(current_price):
+                    if await loop.run_in_executor(self._executor, self.dca_buy, current_price):
                         # After DCA, reset cycle to buy 1 share again
                         self.data['waiting_for_dca'] = False
-                        self.save_data()
-                        print("🔄 CYCLE RESET: Ready to buy next single share")
+                        self._dirty = True
+                        self.log.log(level, "🔄 CYCLE RESET: Ready to buy next single share")
+                    else:
+                        self._action_failed = True
                 else:
-                    print(f"🚨 INSUFFICIENT FUNDS!")
-                    print(f"   Need: ${self.dca_amount:.2f} for DCA")
-                    print(f"   Have: ${balance:.2f}")
+                    self._action_failed = True
+                    self.log.warning("🚨 INSUFFICIENT FUNDS!")
+                    self.log.warning("   Need: $%.2f for DCA", self.dca_amount)
+                    self.log.warning("   Have: $%.2f", balance)
             else:
-                print(f"⏳ WAITING: Current ${current_price:.2f} >= Last ${last_price:.2f}")
-                print("   No action until price drops")
-        
-        # Show position
-        if self.data['total_shares'] > 0:
-            current_value = self.data['total_shares'] * current_price
-            pnl = current_value - self.data['total_invested']
-            avg_cost = self.data['total_invested'] / self.data['total_shares']
+                self.log.log(level, "⏳ WAITING: Current $%.2f >= Last $%.2f", current_price, last_price)
+                self.log.log(level, "   No action until price drops")
+        
+        # Show position (shares/invested/avg cost only change on a trade, which
+        # clears the cache - then it is rebuilt from the post-trade totals)
+        if self._position_cache is not None:
+            shares, invested, avg_cost = self._position_cache
+        else:
+            shares, invested, avg_cost = self.position_summary(position)
+        
+        if shares > 0:
+            current_value = shares * current_price
+            pnl = current_value - invested
+            pnl_pct = pnl / invested * 100 if invested > 0 else 0.0
             
-            print(f"\n📊 TOTAL POSITION:")
-            print(f"   Shares: {self.data['total_shares']:.3f}")
-            print(f"   Invested: ${self.data['total_invested']:.2f}")
-            print(f"   Avg Cost: ${avg_cost:.2f}")
-            print(f"   Current Value: ${current_value:.2f}")
-            print(f"   P&L: ${pnl:.2f} ({(pnl/self.data['total_invested']*100):+.1f}%)")
+            self.log.log(level, "\n📊 TOTAL POSITION:")
+            self.log.log(level, "   Shares: %.3f", shares)
+            self.log.log(level, "   Invested: $%.2f", invested)
+            self.log.log(level, "   Avg Cost: $%.2f", avg_cost)
+            self.log.log(level, "   Current Value: $%.2f", current_value)
+            self.log.log(level, "   P&L: $%.2f (%+.1f%%)", pnl, pnl_pct)
             
             if self.data['waiting_for_dca']:
-                print(f"\n🎯 NEXT ACTION: DCA when price < ${self.data['last_single_share_price']:.2f}")
+                self.log.log(level, "\n🎯 NEXT ACTION: DCA when price < $%.2f", self.data['last_single_share_price'])
             else:
-                print(f"\n🎯 NEXT ACTION: Buy 1 share at current price")
+                self.log.log(level, "\n🎯 NEXT ACTION: Buy 1 share at current price")
 
-if __name__ == "__main__":
-    bot = SOUNCycleBot()
+def setup_logging():
+    """Log to stdout (and a rotating file if LOG_FILE is set) at LOGLEVEL"""
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if os.getenv('LOG_FILE'):
+        handlers.append(RotatingFileHandler(os.getenv('LOG_FILE'), maxBytes=5_000_000, backupCount=3))
+    logging.basicConfig(
+        level=os.getenv('LOGLEVEL', 'INFO').upper(),
+        format='%(message)s',
+        handlers=handlers
+    )
+
+@retry_transient(initial=1, maximum=300)
+async def run_step(bot):
+    """Sleep through closed market hours, otherwise run one cycle"""
+    # May hit the calendar/clock REST endpoints - keep that off the event loop
+    loop = asyncio.get_running_loop()
+    wait = await loop.run_in_executor(bot._executor, bot.seconds_until_open)
+    if wait > 0:
+        log.info("\n🌙 %s: Market closed, sleeping %.1fh until open...", bot.symbol, wait / 3600)
+        await asyncio.sleep(wait)
+        return
     
+    await bot.run()
+
+async def run_bot(bot):
+    """Cycle one bot forever, waking on actionable quotes or the status tick"""
+    while True:
+        await run_step(bot)
+        log.debug("\n⏳ %s: Waiting for next quote (max %ss)...", bot.symbol, bot.idle_timeout())
+        await bot.wait_for_quote()
+
+async def supervise(bot):
+    """Keep one bot running; a crash is logged and restarts only that bot"""
     while True:
         try:
-            bot.run()
-            print("\n⏳ Waiting 1 minute...")
-            time.sleep(60)  # Wait 1 minute
-        except KeyboardInterrupt:
-            print("\n🛑 Bot stopped by user")
-            break
-        except Exception as e:
-            print(f"\n❌ Error: {e}")
-            print("⏳ Retrying in 1 minute...")
-            time.sleep(60)
+            await run_bot(bot)
+        except Exception:
+            log.exception("\n💥 %s: bot crashed, restarting in 60s", bot.symbol)
+            await asyncio.sleep(60)
+
+async def main():
+    symbols = [s.strip().upper() for s in os.getenv('SYMBOLS', 'SOUN').split(',') if s.strip()]
+    workers = worker_count(len(symbols))
+    api = create_api(pool_size=workers)
+    stream = create_stream()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    bots = [SOUNCycleBot(symbol, api, stream, executor) for symbol in symbols]
+    
+    for bot in bots:
+        bot.subscribe()
+    stream_task = asyncio.create_task(stream._run_forever())
+    
+    try:
+        await asyncio.gather(stream_task, *(supervise(bot) for bot in bots))
+    finally:
+        stream_task.cancel()
+
+if __name__ == "__main__":
+    setup_logging()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        log.info("\n🛑 Bot stopped by user")